@@ -3,7 +3,7 @@ from setuptools import setup
 setup(
     name="15-puzzle",
     version="1.0.0",
-    packages=["fifteen_puzzle", "fifteen_puzzle.gui"],
+    packages=["fifteen_puzzle", "fifteen_puzzle.gui", "fifteen_puzzle.solver"],
     package_dir={"fifteen_puzzle": "src"},
     package_data={"fifteen_puzzle.gui": ["data/**/*"]},
     author="Lucas Sousa",
@@ -16,6 +16,7 @@ setup(
         "Programming Language :: Python",
     ],
     install_requires=["Pillow==9.4.0", "pygame==2.1.2"],
+    extras_require={"dataset": ["numpy"]},
     python_requires=">=3.10.0",
     entry_points={
         "console_scripts": ["15-puzzle = fifteen_puzzle.__main__:main"],
@@ -1,25 +1,12 @@
 import pygame
 import random
 import sys
-from PIL import ImageColor
 from pygame.rect import Rect
 
 from .gui.core import GUI
 from .gui.view import View
 from .gui.puzzle_grid import PuzzleGrid
-from .gui.theme import Theme, Style
-
-
-def hex_to_rgb(s):
-    return ImageColor.getcolor(s, "RGB")
-
-
-DEFAULT_STYLE = {
-    "TILE_BG": hex_to_rgb("#3282B8"),
-    "TILE_LABEL_COLOR": (255, 255, 255),
-    "TILE_LABEL_TEXT_SIZE": 24,
-    "PUZZLE_GRID_BG": hex_to_rgb("#1B262C"),
-}
+from .gui.theme import Theme
 
 
 class Game:
@@ -47,7 +34,7 @@ class Game:
     def _process_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                sys.exit()
+                self._quit()
             elif event.type == pygame.VIDEORESIZE:
                 self._screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
 
@@ -57,16 +44,25 @@ class Game:
                 self._gui.viewport = Rect(x, y, h, h)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    sys.exit()
+                    self._quit()
                 elif (
                     pygame.key.get_mods() & pygame.KMOD_CTRL
                     and event.key == pygame.K_SPACE
                 ):
                     self._shuffle_puzzle_grid()
+                elif event.key == pygame.K_h:
+                    self._puzzle_grid.show_hint()
+                elif event.key == pygame.K_t:
+                    self._next_theme()
+
+    def _quit(self):
+        self._puzzle_grid.close()
+
+        sys.exit()
 
     def _draw(self):
         self._buffer.fill((0, 0, 0))
-        self._screen.fill(DEFAULT_STYLE["PUZZLE_GRID_BG"])
+        self._screen.fill(self._screen_bg)
         self._gui.draw(self._buffer)
         self._draw_buffer()
 
@@ -79,6 +75,20 @@ class Game:
 
         self._puzzle_grid.tiles_ordering(tiles_order)
 
+    def _next_theme(self):
+        themes = Theme.available()
+
+        self._theme_index = (self._theme_index + 1) % len(themes)
+        self._theme.load(themes[self._theme_index])
+
+    @property
+    def _screen_bg(self):
+        if self._screen_bg_version != self._theme.version:
+            self._screen_bg_version = self._theme.version
+            self._cached_screen_bg = self._theme.style.get_attr("PUZZLE_GRID_BG")
+
+        return self._cached_screen_bg
+
     @property
     def _scaled_buffer_position(self):
         screen_rect = self._screen.get_rect()
@@ -108,7 +118,11 @@ class Game:
         self._shuffle_puzzle_grid()
 
     def _setup_theme(self):
-        Theme().use(Style.from_dict(DEFAULT_STYLE))
+        self._theme = Theme()
+        self._theme_index = 0
+        self._screen_bg_version = None
+
+        self._theme.load(Theme.available()[self._theme_index])
 
     def run(self) -> None:
         self._setup_theme()
@@ -10,6 +10,7 @@ from .theme import Theme
 from .view import View
 from .event import MouseEvent
 from .utils import resource_filepath
+from ..solver.hint import HintEngine
 
 
 def dist_between_rects(r1, r2):
@@ -22,15 +23,26 @@ def dir_between_rects(r1, r2):
     return ((r1.x - r2.x) / magnitude, (r1.y - r2.y) / magnitude)
 
 
+_fonts = {}
+
+
+def _font(size: int) -> pygame.font.Font:
+    if not size in _fonts:
+        _fonts[size] = pygame.font.Font(resource_filepath("fonts/8bit16.ttf"), size)
+
+    return _fonts[size]
+
+
 class Tile(Widget):
     def __init__(self, value: int, rect=None):
         super().__init__(rect)
 
         self._value = value
-        self._font = pygame.font.Font(
-            resource_filepath("fonts/8bit16.ttf"), self._tile_label_text_size
-        )
+        self._theme = Theme()
+        self._style_version = None
+        self._surfaces = {}
         self._show = True
+        self._highlighted = False
 
     def show(self):
         self._show = True
@@ -38,6 +50,12 @@ class Tile(Widget):
     def hide(self):
         self._show = False
 
+    def highlight(self):
+        self._highlighted = True
+
+    def unhighlight(self):
+        self._highlighted = False
+
     @property
     def value(self) -> int:
         return self._value
@@ -49,32 +67,51 @@ class Tile(Widget):
         if not self._show:
             return
 
-        self._draw_bg(screen)
-        self._draw_label(screen)
+        if self._style_version != self._theme.version:
+            self._resolve_style()
 
-    @property
-    def _tile_bg(self):
-        return Theme().style.get_attr("TILE_BG")
+        screen.blit(self._surface(), self.rect)
 
-    @property
-    def _tile_label_color(self):
-        return Theme().style.get_attr("TILE_LABEL_COLOR")
+    def _resolve_style(self):
+        style = self._theme.style
 
-    @property
-    def _tile_label_text_size(self):
-        return Theme().style.get_attr("TILE_LABEL_TEXT_SIZE")
+        self._style_version = style.version
+        self._tile_bg = style.get_attr("TILE_BG")
+        self._tile_hint_bg = style.get_attr("TILE_HINT_BG")
+        self._tile_label_color = style.get_attr("TILE_LABEL_COLOR")
+        self._font = _font(style.get_attr("TILE_LABEL_TEXT_SIZE"))
+        self._surfaces = {}
 
-    def _draw_bg(self, screen):
-        pygame.draw.rect(screen, self._tile_bg, self.rect, 0, 12)
+    def _surface(self) -> pygame.Surface:
+        key = (self.rect.width, self.rect.height, self._highlighted)
+
+        if not key in self._surfaces:
+            self._surfaces[key] = self._render(*key)
+
+        return self._surfaces[key]
 
-    def _draw_label(self, screen):
+    def _render(self, width: int, height: int, highlighted: bool) -> pygame.Surface:
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        rect = surface.get_rect()
+
+        self._draw_bg(surface, rect, highlighted)
+        self._draw_label(surface, rect)
+
+        return surface
+
+    def _draw_bg(self, surface, rect, highlighted):
+        bg = self._tile_hint_bg if highlighted else self._tile_bg
+
+        pygame.draw.rect(surface, bg, rect, 0, 12)
+
+    def _draw_label(self, surface, rect):
         img = self._font.render(str(self._value), False, self._tile_label_color)
 
         img_rect = img.get_rect()
-        img_rect.x = int(self.rect.x + self.rect.width / 2 - img_rect.width / 2)
-        img_rect.y = int(self.rect.y + self.rect.height / 2 - img_rect.height / 2)
+        img_rect.x = int(rect.x + rect.width / 2 - img_rect.width / 2)
+        img_rect.y = int(rect.y + rect.height / 2 - img_rect.height / 2)
 
-        screen.blit(img, img_rect)
+        surface.blit(img, img_rect)
 
 
 class PuzzleGrid(View):
@@ -86,6 +123,10 @@ class PuzzleGrid(View):
 
         self._tile_drag_and_drop = None
         self._border_width = 8
+        self._hint_engine = HintEngine(on_solution=self._on_hint_solution)
+        self._hint_requested = False
+        self._theme = Theme()
+        self._style_version = None
 
         self.root().connect("mousemove", self._on_root_mousemove)
         self.root().connect("mouseup", self._on_root_mouseup)
@@ -102,8 +143,10 @@ class PuzzleGrid(View):
         if sorted(tiles_ordering) != [i for i in range(16)]:
             raise ValueError("Invalid ordering")
 
+        self._hint_requested = False
         self._create_tiles(tiles_ordering)
         self._update_layout()
+        self._hint_engine.update(tiles_ordering)
 
     def tiles_count(self) -> int:
         return len(self._tiles)
@@ -119,6 +162,17 @@ class PuzzleGrid(View):
 
         self._tiles[a_index], self._tiles[b_index] = b, a
         self._update_layout()
+        self._hint_requested = False
+        self._hint_engine.update([tile.value for tile in self._tiles])
+        self._clear_hint()
+
+    def close(self):
+        self._hint_engine.close()
+
+    def show_hint(self):
+        """Highlights the next tile to move, now or once the solver finishes."""
+        self._hint_requested = True
+        self._highlight_tile(self._hint_engine.next_move())
 
     def get_tile_matrix_index(self, tile: Widget) -> Tuple[int, int]:
         tile_index = self._tiles.index(tile)
@@ -132,6 +186,19 @@ class PuzzleGrid(View):
 
         return None
 
+    def _on_hint_solution(self, solution: List[int]):
+        if self._hint_requested and solution:
+            self._highlight_tile(solution[0])
+
+    def _highlight_tile(self, value: Optional[int]):
+        for tile in self._tiles:
+            if tile.value == value:
+                tile.highlight()
+
+    def _clear_hint(self):
+        for tile in self._tiles:
+            tile.unhighlight()
+
     def _on_root_mousemove(self, e: MouseEvent):
         if self._tile_drag_and_drop:
             self._tile_drag_and_drop.on_mousemove(e)
@@ -206,11 +273,11 @@ class PuzzleGrid(View):
     def _tile_height(self) -> float:
         return (self.rect.height - self._border_width * 5) / 4
 
-    @property
-    def _puzzle_grid_bg(self):
-        return Theme().style.get_attr("PUZZLE_GRID_BG")
-
     def _draw_bg(self, screen):
+        if self._style_version != self._theme.version:
+            self._style_version = self._theme.version
+            self._puzzle_grid_bg = self._theme.style.get_attr("PUZZLE_GRID_BG")
+
         pygame.draw.rect(screen, self._puzzle_grid_bg, self.rect)
 
 
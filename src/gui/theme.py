@@ -1,4 +1,22 @@
-from typing import Dict, Any
+import json
+from types import MappingProxyType
+from typing import Dict, Any, List
+
+from PIL import ImageColor
+
+from .utils import resource_filepath
+
+THEMES = ["dark", "light", "high-contrast"]
+
+
+def _parse_value(value: Any) -> Any:
+    if isinstance(value, str) and value.startswith("#"):
+        return ImageColor.getcolor(value, "RGB")
+
+    if isinstance(value, list):
+        return tuple(value)
+
+    return value
 
 
 class Style:
@@ -14,6 +32,9 @@ class Style:
     def set_attr(self, key: str, value: Any):
         self._attributes[key] = value
 
+    def compile(self, version: int) -> "CompiledStyle":
+        return CompiledStyle(self._attributes, version)
+
     @staticmethod
     def from_dict(s: Dict):
         style = Style()
@@ -23,17 +44,58 @@ class Style:
 
         return style
 
+    @staticmethod
+    def from_json(filepath: str):
+        with open(filepath) as f:
+            attributes = json.load(f)
+
+        return Style.from_dict(
+            {key: _parse_value(attributes[key]) for key in attributes}
+        )
+
+
+class CompiledStyle:
+    """Immutable snapshot of a style, tagged with the theme version it belongs to."""
+
+    __slots__ = ("_attributes", "_version")
+
+    def __init__(self, attributes: Dict, version: int):
+        self._attributes = MappingProxyType(dict(attributes))
+        self._version = version
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get_attr(self, key: str) -> Any:
+        return self._attributes.get(key)
+
 
 class Theme(object):
     def __new__(cls):
         if not hasattr(cls, "instance"):
             cls.instance = super(Theme, cls).__new__(cls)
+            cls.instance._version = 0
+            cls.instance._style = CompiledStyle({}, 0)
 
         return cls.instance
 
     @property
-    def style(self):
+    def style(self) -> CompiledStyle:
         return self._style
 
+    @property
+    def version(self) -> int:
+        """Bumped on every `use`, so widgets know when to re-resolve their style."""
+        return self._version
+
     def use(self, style: Style):
-        self._style = style
+        self._version += 1
+        self._style = style.compile(self._version)
+
+    def load(self, name: str):
+        self.use(Style.from_json(resource_filepath(f"themes/{name}.json")))
+
+    @staticmethod
+    def available() -> List[str]:
+        return list(THEMES)
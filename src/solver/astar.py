@@ -0,0 +1,104 @@
+import heapq
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .board import GOAL, NEIGHBOURS, is_solvable
+from .heuristics import Heuristic, Manhattan
+
+_DEFAULT_BATCH_SIZE = 256
+
+
+class BatchedAStar:
+    """
+    A* that pops up to `batch_size` nodes from the open list at a time and
+    scores all of their children with a single `evaluate_batch` call, so
+    vectorized heuristics pay their call overhead once per batch instead of
+    once per node. With an admissible heuristic the solution is optimal,
+    since the goal is only accepted when it is popped ahead of every child
+    generated so far.
+    """
+
+    def __init__(
+        self,
+        tiles: Sequence[int],
+        heuristic: Optional[Heuristic] = None,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ):
+        if not is_solvable(tiles):
+            raise ValueError("Unsolvable ordering")
+
+        self._tiles = tuple(tiles)
+        self._heuristic = heuristic or Manhattan()
+        self._batch_size = batch_size
+        self._nodes = 0
+
+    @property
+    def nodes(self) -> int:
+        return self._nodes
+
+    def solve(self) -> List[int]:
+        self._nodes = 0
+
+        h = self._heuristic.evaluate(self._tiles)
+        costs: Dict[Tuple[int, ...], int] = {self._tiles: 0}
+        parents: Dict[Tuple[int, ...], Tuple[Tuple[int, ...], int]] = {}
+        open_list = [(h, 0, 0, self._tiles)]
+        counter = 1
+
+        while open_list:
+            children = []
+
+            while open_list and len(children) < self._batch_size:
+                node = heapq.heappop(open_list)
+                _, g, _, tiles = node
+
+                if g != costs[tiles]:
+                    continue
+
+                if tiles == GOAL:
+                    if not children:
+                        return self._path(parents, tiles)
+
+                    # Children of this batch may still lead to a shorter path
+                    heapq.heappush(open_list, node)
+                    break
+
+                self._nodes += 1
+                children += self._expand(tiles, g, costs, parents)
+
+            if not children:
+                continue
+
+            scores = self._heuristic.evaluate_batch([child for child, _ in children])
+
+            for (child, g), h in zip(children, scores):
+                heapq.heappush(open_list, (g + h, g, counter, child))
+                counter += 1
+
+        raise ValueError("Unsolvable ordering")
+
+    def _expand(self, tiles, g, costs, parents) -> List[Tuple[Tuple[int, ...], int]]:
+        blank = tiles.index(0)
+        children = []
+
+        for index in NEIGHBOURS[blank]:
+            child = list(tiles)
+            child[blank], child[index] = child[index], 0
+            child = tuple(child)
+
+            if child in costs and costs[child] <= g + 1:
+                continue
+
+            costs[child] = g + 1
+            parents[child] = (tiles, tiles[index])
+            children.append((child, g + 1))
+
+        return children
+
+    def _path(self, parents, tiles) -> List[int]:
+        path = []
+
+        while tiles in parents:
+            tiles, tile = parents[tiles]
+            path.append(tile)
+
+        return path[::-1]
@@ -0,0 +1,161 @@
+import argparse
+import random
+import time
+from typing import List, Optional, Tuple
+
+from .astar import BatchedAStar
+from .board import GOAL, is_solved, replay, scramble
+from .heuristics import (
+    Heuristic,
+    LinearConflict,
+    Manhattan,
+    MaxHeuristic,
+    MLPHeuristic,
+    PatternDatabase,
+)
+from .ida import IDAStar
+from .parallel import ParallelIDAStar, default_workers
+
+
+def _create_instances(count: int, length: int, seed: int) -> List[Tuple[int, ...]]:
+    rng = random.Random(seed)
+
+    return [scramble(length, rng) for _ in range(count)]
+
+
+def _timed(solver) -> Tuple[List[int], float]:
+    start = time.perf_counter()
+    solution = solver.solve()
+
+    return (solution, time.perf_counter() - start)
+
+
+def _speedup(sequential_time: float, parallel_time: float) -> str:
+    if parallel_time == 0:
+        return "n/a"
+
+    return f"{sequential_time / parallel_time:.2f}x"
+
+
+def _nodes_per_second(nodes: int, elapsed: float) -> str:
+    if elapsed == 0:
+        return "n/a"
+
+    return f"{nodes / elapsed:.0f}"
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compares the sequential and parallel IDA* solvers, or the "
+        "heuristic plug-ins under batched A*."
+    )
+    parser.add_argument("mode", nargs="?", choices=["parallel", "heuristics"])
+    parser.add_argument("--count", type=int, default=5)
+    parser.add_argument("--scramble-length", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--mlp", help="weights file for the MLP heuristic")
+
+    return parser.parse_args()
+
+
+def _create_heuristics(mlp_filepath: Optional[str]) -> List[Heuristic]:
+    pdb = PatternDatabase()
+    heuristics = [
+        Manhattan(),
+        LinearConflict(),
+        pdb,
+        MaxHeuristic(LinearConflict(), pdb),
+    ]
+
+    if mlp_filepath:
+        heuristics.append(MLPHeuristic(mlp_filepath))
+
+    return heuristics
+
+
+def _benchmark_heuristics(args, instances: List[Tuple[int, ...]]):
+    heuristics = _create_heuristics(args.mlp)
+    optimal = [len(IDAStar(tiles).solve()) for tiles in instances]
+
+    print(
+        f"{'heuristic':<32} {'nodes':>10} {'s':>8} {'nodes/s':>10} "
+        f"{'optimal':>8} {'excess':>7}"
+    )
+
+    for heuristic in heuristics:
+        nodes, elapsed, optimal_count, excess = 0, 0.0, 0, 0
+
+        # Builds lazy tables and imports NumPy outside of the timed runs
+        heuristic.evaluate_batch([GOAL])
+
+        for tiles, length in zip(instances, optimal):
+            solver = BatchedAStar(tiles, heuristic, batch_size=args.batch_size)
+            solution, solver_time = _timed(solver)
+
+            if not is_solved(replay(tiles, solution)):
+                raise RuntimeError(f"Invalid solution with {heuristic.name}")
+
+            nodes += solver.nodes
+            elapsed += solver_time
+            optimal_count += len(solution) == length
+            excess += len(solution) - length
+
+        print(
+            f"{heuristic.name:<32} {nodes:>10} {elapsed:>8.3f} "
+            f"{_nodes_per_second(nodes, elapsed):>10} "
+            f"{optimal_count:>4}/{len(instances):<3} {excess:>7}"
+        )
+
+
+def _benchmark_parallel(args, instances: List[Tuple[int, ...]]):
+    sequential_total, parallel_total = 0.0, 0.0
+    workers = args.workers or default_workers()
+
+    print(
+        f"{'#':>3} {'moves':>5} {'seq nodes':>12} {'seq s':>8} "
+        f"{'par nodes':>12} {'par s':>8} {'speedup':>8}"
+    )
+
+    for i, tiles in enumerate(instances):
+        sequential = IDAStar(tiles)
+        parallel = ParallelIDAStar(tiles, workers=workers)
+
+        sequential_solution, sequential_time = _timed(sequential)
+        parallel_solution, parallel_time = _timed(parallel)
+
+        if len(sequential_solution) != len(parallel_solution):
+            raise RuntimeError(f"Solution lengths differ on instance {i}")
+
+        if not is_solved(replay(tiles, parallel_solution)):
+            raise RuntimeError(f"Invalid parallel solution on instance {i}")
+
+        sequential_total += sequential_time
+        parallel_total += parallel_time
+
+        print(
+            f"{i:>3} {len(sequential_solution):>5} {sequential.nodes:>12} "
+            f"{sequential_time:>8.3f} {parallel.nodes:>12} {parallel_time:>8.3f} "
+            f"{_speedup(sequential_time, parallel_time):>8}"
+        )
+
+    print(
+        f"total: sequential {sequential_total:.3f}s, "
+        f"parallel {parallel_total:.3f}s ({workers} workers), "
+        f"speedup {_speedup(sequential_total, parallel_total)}"
+    )
+
+
+def main():
+    args = _parse_args()
+    instances = _create_instances(args.count, args.scramble_length, args.seed)
+
+    if args.mode == "heuristics":
+        _benchmark_heuristics(args, instances)
+    else:
+        _benchmark_parallel(args, instances)
+
+
+if __name__ == "__main__":
+    main()
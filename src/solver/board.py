@@ -0,0 +1,82 @@
+import random
+from typing import List, Optional, Sequence, Tuple
+
+SIZE = 4
+TILES_COUNT = SIZE * SIZE
+GOAL = tuple([i for i in range(1, TILES_COUNT)] + [0])
+
+
+def _create_neighbours(index: int) -> Tuple[int, ...]:
+    x, y = index % SIZE, index // SIZE
+    neighbours = [(x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)]
+
+    return tuple(
+        ny * SIZE + nx
+        for nx, ny in neighbours
+        if nx >= 0 and nx < SIZE and ny >= 0 and ny < SIZE
+    )
+
+
+NEIGHBOURS = tuple(_create_neighbours(i) for i in range(TILES_COUNT))
+
+
+def validate(tiles: Sequence[int]):
+    if sorted(tiles) != [i for i in range(TILES_COUNT)]:
+        raise ValueError("Invalid ordering")
+
+
+def is_solvable(tiles: Sequence[int]) -> bool:
+    validate(tiles)
+
+    values = [tile for tile in tiles if tile != 0]
+    inversions = sum(
+        1
+        for i in range(len(values))
+        for j in range(i + 1, len(values))
+        if values[i] > values[j]
+    )
+    blank_row_from_bottom = SIZE - list(tiles).index(0) // SIZE
+
+    return (inversions + blank_row_from_bottom) % 2 == 1
+
+
+def is_solved(tiles: Sequence[int]) -> bool:
+    return tuple(tiles) == GOAL
+
+
+def slide(tiles: Sequence[int], tile: int) -> Tuple[int, ...]:
+    """Slides `tile` into the empty space, returning the new ordering."""
+    blank = list(tiles).index(0)
+    index = list(tiles).index(tile)
+
+    if index not in NEIGHBOURS[blank]:
+        raise ValueError("Tile is not next to the empty space")
+
+    result = list(tiles)
+    result[blank], result[index] = tile, 0
+
+    return tuple(result)
+
+
+def scramble(length: int, rng: Optional[random.Random] = None) -> Tuple[int, ...]:
+    """Random walk from the goal, never undoing the previous move."""
+    rng = rng or random.Random()
+    tiles = list(GOAL)
+    blank = tiles.index(0)
+    prev = None
+
+    for _ in range(length):
+        index = rng.choice([i for i in NEIGHBOURS[blank] if i != prev])
+        tiles[blank], tiles[index] = tiles[index], 0
+        prev, blank = blank, index
+
+    return tuple(tiles)
+
+
+def replay(tiles: Sequence[int], moves: List[int]) -> Tuple[int, ...]:
+    result = tuple(tiles)
+
+    for tile in moves:
+        result = slide(result, tile)
+
+    return result
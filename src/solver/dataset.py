@@ -0,0 +1,218 @@
+import argparse
+import os
+import random
+from multiprocessing import Pool
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .board import NEIGHBOURS, TILES_COUNT, scramble, validate
+from .ida import IDAStar
+
+MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT = 0, 1, 2, 3
+NO_MOVE = 255
+
+_DEFAULT_CHECKPOINT = 1024
+
+
+def pack(tiles: Sequence[int]) -> int:
+    """Packs an ordering into 64 bits, four bits per tile, index 0 lowest."""
+    validate(tiles)
+
+    return sum(tile << (4 * index) for index, tile in enumerate(tiles))
+
+
+def unpack(value: int) -> Tuple[int, ...]:
+    return tuple((int(value) >> (4 * index)) & 0xF for index in range(TILES_COUNT))
+
+
+def move_label(tiles: Sequence[int], tile: int) -> int:
+    """Labels a move by the direction the empty space travels."""
+    blank = list(tiles).index(0)
+    index = list(tiles).index(tile)
+
+    if index not in NEIGHBOURS[blank]:
+        raise ValueError("Tile is not next to the empty space")
+
+    return {-4: MOVE_UP, 4: MOVE_DOWN, -1: MOVE_LEFT, 1: MOVE_RIGHT}[index - blank]
+
+
+def shard_filepath(directory: str, shard: int, partial: bool = False) -> str:
+    suffix = ".partial.npz" if partial else ".npz"
+
+    return os.path.join(directory, f"shard-{shard:05d}{suffix}")
+
+
+class ShardExporter:
+    """
+    Labels the positions of one shard and writes them to a compressed `.npz`
+    file with `boards` (uint64), `distances` (uint8) and `moves` (uint8),
+    plus `meta` (int64) recording the seed, shard size and scramble length.
+
+    Positions come from a random generator seeded by the dataset seed and the
+    shard number, so a shard is the same on every run. Progress is saved to a
+    partial file every `checkpoint` positions; an interrupted shard resumes
+    from it by replaying the generator past the positions already labelled.
+    Existing files made with different parameters are rejected.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        seed: int,
+        size: int,
+        scramble_length: int,
+        checkpoint: int = _DEFAULT_CHECKPOINT,
+    ):
+        if checkpoint <= 0:
+            raise ValueError("Checkpoint should be positive")
+
+        self._directory = directory
+        self._seed = seed
+        self._size = size
+        self._scramble_length = scramble_length
+        self._checkpoint = checkpoint
+
+    def export(self, shard: int) -> int:
+        """Writes the shard unless it already exists. Returns its number."""
+        filepath = shard_filepath(self._directory, shard)
+
+        if os.path.exists(filepath):
+            with np.load(filepath) as data:
+                self._check_meta(filepath, data)
+
+            return shard
+
+        boards = np.zeros(self._size, dtype=np.uint64)
+        distances = np.zeros(self._size, dtype=np.uint8)
+        moves = np.zeros(self._size, dtype=np.uint8)
+        done = self._load_partial(shard, boards, distances, moves)
+        rng = random.Random(f"{self._seed}:{shard}")
+
+        for i in range(self._size):
+            tiles = scramble(rng.randint(1, self._scramble_length), rng)
+
+            if i < done:
+                continue
+
+            solution = IDAStar(tiles).solve()
+
+            boards[i] = pack(tiles)
+            distances[i] = len(solution)
+            moves[i] = move_label(tiles, solution[0]) if solution else NO_MOVE
+
+            if (i + 1) % self._checkpoint == 0 and i + 1 < self._size:
+                self._save(
+                    shard_filepath(self._directory, shard, partial=True),
+                    boards[: i + 1],
+                    distances[: i + 1],
+                    moves[: i + 1],
+                )
+
+        self._save(shard_filepath(self._directory, shard), boards, distances, moves)
+
+        if os.path.exists(shard_filepath(self._directory, shard, partial=True)):
+            os.remove(shard_filepath(self._directory, shard, partial=True))
+
+        return shard
+
+    def _load_partial(self, shard: int, boards, distances, moves) -> int:
+        filepath = shard_filepath(self._directory, shard, partial=True)
+
+        if not os.path.exists(filepath):
+            return 0
+
+        with np.load(filepath) as data:
+            self._check_meta(filepath, data)
+
+            done = min(len(data["boards"]), self._size)
+
+            boards[:done] = data["boards"][:done]
+            distances[:done] = data["distances"][:done]
+            moves[:done] = data["moves"][:done]
+
+        return done
+
+    @property
+    def _meta(self):
+        return np.array([self._seed, self._size, self._scramble_length], np.int64)
+
+    def _check_meta(self, filepath: str, data):
+        if not "meta" in data or not np.array_equal(data["meta"], self._meta):
+            raise ValueError(
+                f"{filepath} was written with a different seed, shard size "
+                "or scramble length"
+            )
+
+    def _save(self, filepath: str, boards, distances, moves):
+        tmp_filepath = filepath + ".tmp"
+
+        with open(tmp_filepath, "wb") as f:
+            np.savez_compressed(
+                f, boards=boards, distances=distances, moves=moves, meta=self._meta
+            )
+
+        os.replace(tmp_filepath, filepath)
+
+
+def export(
+    directory: str,
+    shards: int,
+    shard_size: int,
+    seed: int = 0,
+    scramble_length: int = 40,
+    workers: Optional[int] = None,
+    checkpoint: int = _DEFAULT_CHECKPOINT,
+    on_shard: Optional[Callable[[int], None]] = None,
+):
+    """
+    Streams the shards through a process pool and returns once all of them
+    are written, calling `on_shard` with each shard number as it finishes.
+    Each worker holds a single shard in memory at a time, which bounds memory
+    to `workers * shard_size` positions however large the dataset is.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    exporter = ShardExporter(directory, seed, shard_size, scramble_length, checkpoint)
+
+    with Pool(workers) as pool:
+        for shard in pool.imap_unordered(exporter.export, range(shards)):
+            if on_shard:
+                on_shard(shard)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description="Exports labelled positions with their optimal distance and move."
+    )
+    parser.add_argument("directory")
+    parser.add_argument("--shards", type=int, default=1)
+    parser.add_argument("--shard-size", type=int, default=65536)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scramble-length", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--checkpoint", type=int, default=_DEFAULT_CHECKPOINT)
+
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+
+    def on_shard(shard: int):
+        print(f"shard {shard} written to {shard_filepath(args.directory, shard)}")
+
+    export(
+        args.directory,
+        args.shards,
+        args.shard_size,
+        seed=args.seed,
+        scramble_length=args.scramble_length,
+        workers=args.workers,
+        checkpoint=args.checkpoint,
+        on_shard=on_shard,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .board import GOAL, NEIGHBOURS, SIZE, TILES_COUNT
+from .ida import _DISTANCE, manhattan_distance
+
+_GOAL_INDEX = [GOAL.index(tile) for tile in range(TILES_COUNT)]
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """NumPy if it is installed, otherwise None. Imported on first use."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+class Heuristic(ABC):
+    """
+    Estimates the number of moves left for a board. Solvers call `evaluate`
+    one board at a time, or `evaluate_batch` to score a whole frontier in a
+    single call, which plug-ins backed by vectorized code should override.
+    """
+
+    name = "heuristic"
+
+    @abstractmethod
+    def evaluate(self, tiles: Sequence[int]) -> int:
+        pass
+
+    def evaluate_batch(self, boards: Sequence[Sequence[int]]) -> List[int]:
+        return [self.evaluate(tiles) for tiles in boards]
+
+    def __call__(self, tiles: Sequence[int]) -> int:
+        return self.evaluate(tiles)
+
+
+class Manhattan(Heuristic):
+    """Batches are scored with NumPy when it is installed."""
+
+    name = "manhattan"
+
+    def __init__(self):
+        self._distances = None
+
+    def evaluate(self, tiles: Sequence[int]) -> int:
+        return manhattan_distance(tiles)
+
+    def evaluate_batch(self, boards: Sequence[Sequence[int]]) -> List[int]:
+        np = _numpy()
+
+        if np is None:
+            return super().evaluate_batch(boards)
+
+        if self._distances is None:
+            self._distances = np.array(_DISTANCE, dtype=np.int64)
+
+        boards = np.asarray(boards, dtype=np.intp).reshape(-1, TILES_COUNT)
+        h = self._distances[boards, np.arange(TILES_COUNT)].sum(axis=1)
+
+        return h.tolist()
+
+
+def _longest_increasing_subsequence(values: List[int]) -> int:
+    tails = []
+
+    for value in values:
+        i = bisect_left(tails, value)
+
+        if i == len(tails):
+            tails.append(value)
+        else:
+            tails[i] = value
+
+    return len(tails)
+
+
+class LinearConflict(Heuristic):
+    """
+    Manhattan distance plus two moves for every tile that has to leave its
+    goal row or column to let the others in that line pass.
+    """
+
+    name = "linear-conflict"
+
+    def evaluate(self, tiles: Sequence[int]) -> int:
+        h = manhattan_distance(tiles)
+
+        for line in range(SIZE):
+            row, column = [], []
+
+            for i in range(SIZE):
+                tile = tiles[line * SIZE + i]
+
+                if tile and _GOAL_INDEX[tile] // SIZE == line:
+                    row.append(_GOAL_INDEX[tile] % SIZE)
+
+                tile = tiles[i * SIZE + line]
+
+                if tile and _GOAL_INDEX[tile] % SIZE == line:
+                    column.append(_GOAL_INDEX[tile] // SIZE)
+
+            h += 2 * (len(row) - _longest_increasing_subsequence(row))
+            h += 2 * (len(column) - _longest_increasing_subsequence(column))
+
+        return h
+
+
+class PatternDatabase(Heuristic):
+    """
+    Additive pattern database over disjoint groups of tiles. Each table holds
+    the moves of the group's own tiles needed to bring them home, found by a
+    0-1 breadth-first search back from the goal, so the tables can be summed.
+    """
+
+    name = "pdb"
+
+    def __init__(self, groups: Optional[Sequence[Sequence[int]]] = None):
+        self._groups = [tuple(group) for group in groups or _DEFAULT_GROUPS]
+
+        tiles = [tile for group in self._groups for tile in group]
+
+        if len(tiles) != len(set(tiles)) or not set(tiles) <= set(GOAL) - {0}:
+            raise ValueError("Pattern groups must be disjoint sets of tiles")
+
+        self._tables = [_build_pattern_table(group) for group in self._groups]
+        self._arrays = None
+
+    def evaluate(self, tiles: Sequence[int]) -> int:
+        positions = [0] * TILES_COUNT
+
+        for index, tile in enumerate(tiles):
+            positions[tile] = index
+
+        return sum(
+            table[tuple(positions[tile] for tile in group)]
+            for group, table in zip(self._groups, self._tables)
+        )
+
+    def evaluate_batch(self, boards: Sequence[Sequence[int]]) -> List[int]:
+        """
+        Looks every board up at once in flat copies of the tables, indexed by
+        the group's positions packed four bits each. Without NumPy the boards
+        are looked up one at a time.
+        """
+        np = _numpy()
+
+        if np is None:
+            return super().evaluate_batch(boards)
+
+        if self._arrays is None:
+            self._arrays = [_pattern_array(np, table) for table in self._tables]
+
+        boards = np.asarray(boards, dtype=np.intp).reshape(-1, TILES_COUNT)
+        positions = np.argsort(boards, axis=1)
+        h = np.zeros(len(boards), dtype=np.int64)
+
+        for group, array in zip(self._groups, self._arrays):
+            index = np.zeros(len(boards), dtype=np.intp)
+
+            for tile in group:
+                index = (index << 4) | positions[:, tile]
+
+            h += array[index]
+
+        return h.tolist()
+
+
+_DEFAULT_GROUPS = ((1, 2, 3), (4, 5, 6), (7, 8, 9), (10, 11, 12), (13, 14, 15))
+
+
+def _build_pattern_table(group: Tuple[int, ...]) -> Dict[Tuple[int, ...], int]:
+    start = (tuple(GOAL.index(tile) for tile in group), GOAL.index(0))
+    costs = {start: 0}
+    queue = deque([start])
+
+    while queue:
+        state = queue.popleft()
+        positions, blank = state
+        cost = costs[state]
+
+        for index in NEIGHBOURS[blank]:
+            if index in positions:
+                moved = tuple(blank if p == index else p for p in positions)
+                child, child_cost = (moved, index), cost + 1
+            else:
+                child, child_cost = (positions, index), cost
+
+            if child in costs and costs[child] <= child_cost:
+                continue
+
+            costs[child] = child_cost
+
+            if child_cost == cost:
+                queue.appendleft(child)
+            else:
+                queue.append(child)
+
+    table = {}
+
+    for (positions, _), cost in costs.items():
+        if not positions in table or cost < table[positions]:
+            table[positions] = cost
+
+    return table
+
+
+def _pattern_array(np, table: Dict[Tuple[int, ...], int]):
+    group_size = len(next(iter(table)))
+    array = np.zeros(1 << (4 * group_size), dtype=np.uint8)
+
+    for positions, cost in table.items():
+        index = 0
+
+        for position in positions:
+            index = (index << 4) | position
+
+        array[index] = cost
+
+    return array
+
+
+class FunctionHeuristic(Heuristic):
+    """Wraps an external scoring function, with an optional batched version."""
+
+    def __init__(
+        self,
+        function: Callable[[Sequence[int]], int],
+        batch_function: Optional[Callable[[Sequence[Sequence[int]]], List[int]]] = None,
+        name: str = "function",
+    ):
+        self._function = function
+        self._batch_function = batch_function
+        self.name = name
+
+    def evaluate(self, tiles: Sequence[int]) -> int:
+        return int(self._function(tiles))
+
+    def evaluate_batch(self, boards: Sequence[Sequence[int]]) -> List[int]:
+        if self._batch_function is None:
+            return super().evaluate_batch(boards)
+
+        return [int(h) for h in self._batch_function(boards)]
+
+
+class MLPHeuristic(Heuristic):
+    """
+    Small multilayer perceptron loaded from a `.npz` file holding `W0`, `b0`,
+    `W1`, `b1`, ... with ReLU between layers. The input is the one-hot
+    encoding of which tile sits at each position. Learned estimates are not
+    guaranteed to be admissible, so solutions may be longer than optimal.
+    """
+
+    name = "mlp"
+
+    def __init__(self, filepath: str):
+        import numpy as np
+
+        self._np = np
+        self._layers = []
+
+        with np.load(filepath) as weights:
+            while f"W{len(self._layers)}" in weights:
+                i = len(self._layers)
+                self._layers.append((weights[f"W{i}"], weights[f"b{i}"]))
+
+        if not self._layers:
+            raise ValueError("No layers found in weights file")
+
+    def evaluate(self, tiles: Sequence[int]) -> int:
+        return self.evaluate_batch([tiles])[0]
+
+    def evaluate_batch(self, boards: Sequence[Sequence[int]]) -> List[int]:
+        np = self._np
+        boards = np.asarray(boards, dtype=np.intp)
+        x = np.zeros((len(boards), TILES_COUNT * TILES_COUNT), dtype=np.float32)
+        rows = np.repeat(np.arange(len(boards)), TILES_COUNT)
+        columns = (np.arange(TILES_COUNT) * TILES_COUNT + boards).ravel()
+        x[rows, columns] = 1.0
+
+        for i, (w, b) in enumerate(self._layers):
+            x = x @ w + b
+
+            if i < len(self._layers) - 1:
+                x = np.maximum(x, 0.0)
+
+        return np.maximum(np.rint(x[:, 0]), 0).astype(int).tolist()
+
+
+class MaxHeuristic(Heuristic):
+    """Largest estimate among the plug-ins. Admissible if all of them are."""
+
+    def __init__(self, *heuristics: Heuristic):
+        self._heuristics = heuristics
+        self.name = "max(" + ", ".join(h.name for h in heuristics) + ")"
+
+    def evaluate(self, tiles: Sequence[int]) -> int:
+        return max(h.evaluate(tiles) for h in self._heuristics)
+
+    def evaluate_batch(self, boards: Sequence[Sequence[int]]) -> List[int]:
+        scores = [h.evaluate_batch(boards) for h in self._heuristics]
+
+        return [max(values) for values in zip(*scores)]
+
+
+class AddHeuristic(Heuristic):
+    """Sum of the plug-ins. Only admissible if they count disjoint moves."""
+
+    def __init__(self, *heuristics: Heuristic):
+        self._heuristics = heuristics
+        self.name = "add(" + ", ".join(h.name for h in heuristics) + ")"
+
+    def evaluate(self, tiles: Sequence[int]) -> int:
+        return sum(h.evaluate(tiles) for h in self._heuristics)
+
+    def evaluate_batch(self, boards: Sequence[Sequence[int]]) -> List[int]:
+        scores = [h.evaluate_batch(boards) for h in self._heuristics]
+
+        return [sum(values) for values in zip(*scores)]
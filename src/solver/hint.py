@@ -0,0 +1,153 @@
+import multiprocessing
+import sys
+import threading
+import traceback
+from functools import partial
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .board import NEIGHBOURS, is_solvable
+from .ida import IDAStar, SearchCancelled
+
+_generation = None
+
+
+def _init_worker(generation):
+    global _generation
+
+    _generation = generation
+
+
+def _solve(
+    tiles: Tuple[int, ...], fallback: Optional[List[int]], generation: int
+) -> Optional[List[int]]:
+    """
+    Runs in the worker process. Returns None when the board changed before
+    or during the search.
+    """
+    if _generation.value != generation:
+        return None
+
+    solver = IDAStar(tiles, stop=lambda: _generation.value != generation)
+
+    try:
+        if fallback is None:
+            return solver.solve()
+
+        bound = len(fallback) - 2
+
+        if bound < 0:
+            return fallback
+
+        return solver.solve(bound=bound, max_bound=bound) or fallback
+    except SearchCancelled:
+        return None
+
+
+def _moved_tile(before: Sequence[int], after: Sequence[int]) -> Optional[int]:
+    """Returns the tile slid between two orderings one move apart."""
+    changed = [i for i in range(len(before)) if before[i] != after[i]]
+
+    if len(changed) != 2:
+        return None
+
+    a, b = changed
+    is_swap = after[a] == before[b] and after[b] == before[a]
+
+    if not is_swap or b not in NEIGHBOURS[a] or 0 not in (before[a], before[b]):
+        return None
+
+    return before[a] or before[b]
+
+
+class HintEngine:
+    """
+    Keeps an optimal solution for the board in sync with the player's moves.
+
+    Following the hint just shifts the cached solution. Deviating by one move
+    leaves two candidates by parity: the old length minus one, or the old
+    solution prefixed with the undo move, so a single IDA* iteration at the
+    cached bound repairs it. Anything else triggers a full solve.
+
+    Searches run in a separate process, so they never hold the GIL of the
+    game loop. The board generation is shared with that process, which
+    abandons a search as soon as the board changes. `on_solution` is called
+    from a background thread once a search for the current board finishes.
+    """
+
+    def __init__(self, on_solution: Optional[Callable[[List[int]], None]] = None):
+        context = multiprocessing.get_context("spawn")
+
+        self._on_solution = on_solution
+        self._tiles: Optional[Tuple[int, ...]] = None
+        self._solution: Optional[List[int]] = None
+        self._lock = threading.Lock()
+        self._generation = context.Value("i", 0, lock=False)
+        self._pool = context.Pool(
+            1, initializer=_init_worker, initargs=(self._generation,)
+        )
+
+    @property
+    def solution(self) -> Optional[List[int]]:
+        with self._lock:
+            return list(self._solution) if self._solution is not None else None
+
+    def next_move(self) -> Optional[int]:
+        """Returns the tile to slide next, or None while no hint is known."""
+        with self._lock:
+            return self._solution[0] if self._solution else None
+
+    def update(self, tiles: Sequence[int]):
+        tiles = tuple(tiles)
+
+        with self._lock:
+            previous, solution = self._tiles, self._solution
+
+            if tiles == previous:
+                return
+
+            self._tiles = tiles
+            self._solution = None
+            self._generation.value += 1
+
+            if not is_solvable(tiles):
+                return
+
+            fallback = None
+
+            if previous is not None and solution is not None:
+                moved = _moved_tile(previous, tiles)
+
+                if moved is not None and solution and moved == solution[0]:
+                    self._solution = solution[1:]
+
+                    return
+
+                if moved is not None:
+                    fallback = [moved] + solution
+
+            generation = self._generation.value
+
+        self._pool.apply_async(
+            _solve,
+            (tiles, fallback, generation),
+            callback=partial(self._on_result, generation),
+            error_callback=self._on_error,
+        )
+
+    def close(self):
+        self._generation.value += 1
+        self._pool.terminate()
+
+    def _on_result(self, generation: int, solution: Optional[List[int]]):
+        with self._lock:
+            if solution is None or generation != self._generation.value:
+                return
+
+            self._solution = solution
+
+            if self._on_solution:
+                self._on_solution(list(solution))
+
+    def _on_error(self, error: BaseException):
+        print("Hint search failed:", file=sys.stderr)
+        traceback.print_exception(error, file=sys.stderr)
@@ -0,0 +1,181 @@
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+
+from .board import GOAL, NEIGHBOURS, TILES_COUNT, SIZE, is_solvable
+
+if TYPE_CHECKING:
+    from .heuristics import Heuristic
+
+FOUND = -1
+INFINITY = 1 << 30
+
+_STOP_CHECK_MASK = 4095
+
+
+def _create_distance_table() -> List[List[int]]:
+    table = [[0] * TILES_COUNT for _ in range(TILES_COUNT)]
+
+    for tile in range(1, TILES_COUNT):
+        goal = GOAL.index(tile)
+
+        for index in range(TILES_COUNT):
+            table[tile][index] = abs(index % SIZE - goal % SIZE) + abs(
+                index // SIZE - goal // SIZE
+            )
+
+    return table
+
+
+_DISTANCE = _create_distance_table()
+_GOAL_TILES = list(GOAL)
+
+
+def manhattan_distance(tiles: Sequence[int]) -> int:
+    return sum(_DISTANCE[tile][index] for index, tile in enumerate(tiles))
+
+
+class SearchCancelled(Exception):
+    pass
+
+
+class DepthFirstSearch:
+    """
+    Bounded depth-first search used by every IDA* iteration. The board is
+    mutated in place and, unless a heuristic plug-in is given, the Manhattan
+    distance is updated incrementally.
+    """
+
+    def __init__(
+        self,
+        tiles: Sequence[int],
+        path: Optional[List[int]] = None,
+        stop: Optional[Callable[[], bool]] = None,
+        heuristic: Optional["Heuristic"] = None,
+    ):
+        self._tiles = list(tiles)
+        self._blank = self._tiles.index(0)
+        self._path = list(path or [])
+        self._stop = stop
+        self._heuristic = heuristic
+        self.nodes = 0
+
+    @property
+    def path(self) -> List[int]:
+        return list(self._path)
+
+    def run(self, g: int, h: int, bound: int, prev: Optional[int]) -> int:
+        """
+        Returns `FOUND` when the goal is reached within `bound`, otherwise the
+        smallest f value that exceeded it.
+        """
+        f = g + h
+
+        if f > bound:
+            return f
+
+        if self._heuristic is None:
+            if h == 0:
+                return FOUND
+        elif self._tiles == _GOAL_TILES:
+            return FOUND
+
+        self.nodes += 1
+
+        if self._stop and self.nodes & _STOP_CHECK_MASK == 0 and self._stop():
+            raise SearchCancelled()
+
+        tiles = self._tiles
+        blank = self._blank
+        minimum = INFINITY
+
+        for index in NEIGHBOURS[blank]:
+            if index == prev:
+                continue
+
+            tile = tiles[index]
+
+            tiles[blank], tiles[index] = tile, 0
+            self._blank = index
+            self._path.append(tile)
+
+            if self._heuristic is None:
+                child_h = h + _DISTANCE[tile][blank] - _DISTANCE[tile][index]
+            else:
+                child_h = self._heuristic.evaluate(tiles)
+
+            result = self.run(g + 1, child_h, bound, blank)
+
+            if result == FOUND:
+                return FOUND
+
+            self._path.pop()
+            tiles[blank], tiles[index] = 0, tile
+            self._blank = blank
+
+            if result < minimum:
+                minimum = result
+
+        return minimum
+
+
+class IDAStar:
+    def __init__(
+        self,
+        tiles: Sequence[int],
+        stop: Optional[Callable[[], bool]] = None,
+        heuristic: Optional["Heuristic"] = None,
+    ):
+        if not is_solvable(tiles):
+            raise ValueError("Unsolvable ordering")
+
+        self._tiles = tuple(tiles)
+        self._stop = stop
+        self._heuristic = heuristic
+        self._nodes = 0
+
+    @property
+    def nodes(self) -> int:
+        return self._nodes
+
+    def solve(
+        self, bound: Optional[int] = None, max_bound: Optional[int] = None
+    ) -> Optional[List[int]]:
+        """
+        Returns the tiles to slide, in order, along an optimal solution. The
+        search starts at `bound` when given and gives up with `None` once the
+        threshold would grow past `max_bound`.
+        """
+        if self._heuristic is None:
+            h = manhattan_distance(self._tiles)
+        else:
+            h = self._heuristic.evaluate(self._tiles)
+
+        bound = max(h, bound or 0)
+
+        while max_bound is None or bound <= max_bound:
+            search = DepthFirstSearch(
+                self._tiles, stop=self._stop, heuristic=self._heuristic
+            )
+
+            try:
+                result = search.run(0, h, bound, None)
+            finally:
+                self._nodes += search.nodes
+
+            if result == FOUND:
+                return search.path
+
+            if result == INFINITY:
+                return None
+
+            bound = result
+
+        return None
+
+
+def solve(tiles: Sequence[int], heuristic: Optional["Heuristic"] = None) -> List[int]:
+    solution = IDAStar(tiles, heuristic=heuristic).solve()
+
+    if solution is None:
+        raise ValueError("Unsolvable ordering")
+
+    return solution
@@ -0,0 +1,176 @@
+import multiprocessing
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from .board import NEIGHBOURS, is_solvable
+from .ida import (
+    FOUND,
+    INFINITY,
+    DepthFirstSearch,
+    SearchCancelled,
+    manhattan_distance,
+)
+
+# (tiles, previous blank index, path, h)
+WorkItem = Tuple[Tuple[int, ...], Optional[int], Tuple[int, ...], int]
+
+_ITEMS_PER_WORKER = 16
+
+_found = None
+_bound = None
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def _init_worker(found, bound):
+    global _found, _bound
+
+    _found = found
+    _bound = bound
+
+
+def _search_work_item(item: WorkItem) -> Tuple[Optional[List[int]], int, int]:
+    tiles, prev, path, h = item
+
+    if _found.is_set():
+        return (None, INFINITY, 0)
+
+    search = DepthFirstSearch(tiles, path=list(path), stop=_found.is_set)
+
+    try:
+        result = search.run(len(path), h, _bound.value, prev)
+    except SearchCancelled:
+        return (None, INFINITY, search.nodes)
+
+    if result == FOUND:
+        _found.set()
+
+        return (search.path, FOUND, search.nodes)
+
+    return (None, result, search.nodes)
+
+
+def _expand(item: WorkItem) -> List[WorkItem]:
+    tiles, prev, path, _ = item
+    blank = tiles.index(0)
+    children = []
+
+    for index in NEIGHBOURS[blank]:
+        if index == prev:
+            continue
+
+        child = list(tiles)
+        child[blank], child[index] = child[index], 0
+        children.append(
+            (tuple(child), blank, path + (tiles[index],), manhattan_distance(child))
+        )
+
+    return children
+
+
+class ParallelIDAStar:
+    """
+    IDA* that splits the tree at a shallow depth into work items which are
+    handed out one at a time to a pool of worker processes, so idle workers
+    keep pulling the remaining subtrees. Workers read the threshold from
+    shared memory and stop as soon as any of them reaches the goal.
+    """
+
+    def __init__(
+        self,
+        tiles: Sequence[int],
+        workers: Optional[int] = None,
+        work_items: Optional[int] = None,
+    ):
+        if not is_solvable(tiles):
+            raise ValueError("Unsolvable ordering")
+
+        self._tiles = tuple(tiles)
+        self._workers = workers or default_workers()
+        self._work_items = work_items or self._workers * _ITEMS_PER_WORKER
+        self._nodes = 0
+
+    @property
+    def nodes(self) -> int:
+        return self._nodes
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def solve(self) -> List[int]:
+        self._nodes = 0
+
+        items, solution = self._split()
+
+        if solution is not None:
+            return solution
+
+        bound = min(len(item[2]) + item[3] for item in items)
+        context = multiprocessing.get_context()
+        found = context.Event()
+        shared_bound = context.Value("i", bound, lock=False)
+
+        with context.Pool(
+            self._workers, initializer=_init_worker, initargs=(found, shared_bound)
+        ) as pool:
+            while True:
+                shared_bound.value = bound
+                solution, next_bound = self._run_iteration(pool, items, bound)
+
+                if solution is not None:
+                    return solution
+
+                if next_bound == INFINITY:
+                    raise ValueError("Unsolvable ordering")
+
+                bound = next_bound
+
+    def _split(self) -> Tuple[List[WorkItem], Optional[List[int]]]:
+        """
+        Expands the root breadth first until there are enough work items. A
+        goal met on the way is optimal, since every shallower level has been
+        fully generated.
+        """
+        level = [(self._tiles, None, (), manhattan_distance(self._tiles))]
+
+        while True:
+            for item in level:
+                if item[3] == 0:
+                    return ([], list(item[2]))
+
+            if len(level) >= self._work_items:
+                return (level, None)
+
+            level = [child for item in level for child in _expand(item)]
+            self._nodes += len(level)
+
+    def _run_iteration(
+        self, pool, items: List[WorkItem], bound: int
+    ) -> Tuple[Optional[List[int]], int]:
+        next_bound = INFINITY
+        pending = []
+
+        for item in items:
+            f = len(item[2]) + item[3]
+
+            if f > bound:
+                next_bound = min(next_bound, f)
+            else:
+                pending.append(item)
+
+        solution = None
+
+        for path, result, nodes in pool.imap_unordered(
+            _search_work_item, pending, chunksize=1
+        ):
+            self._nodes += nodes
+
+            if result == FOUND and solution is None:
+                solution = path
+            elif result != FOUND:
+                next_bound = min(next_bound, result)
+
+        return (solution, next_bound)